@@ -0,0 +1,50 @@
+"""One-time conversion of causal7_dat.csv to Parquet.
+
+Run once after updating the CSV; the analysis scripts read
+causal7_dat.parquet instead of re-parsing the CSV on every run.
+
+``party`` and ``screen_name`` are stored as categoricals, so
+``pd.read_parquet`` returns them with category dtype and grouping and
+``isin`` work on the integer codes rather than Python strings. ``pop`` is
+parsed straight to ``int8``; a blank or non-numeric value fails here rather
+than being coerced downstream. ``new24`` ("Yes"/"No") is stored as a
+boolean, so no ``== "Yes"`` pass is needed after loading.
+
+Rows are written in ``day`` order (stable, so ties keep their CSV order).
+Row-group statistics then let date filters skip whole groups, and a date
+cut on the loaded frame is a ``searchsorted`` on ``day`` plus ``iloc``.
+"""
+
+import pandas as pd
+
+SOURCE = "causal7_dat.csv"
+TARGET = "causal7_dat.parquet"
+
+
+def main():
+    df = pd.read_csv(
+        SOURCE,
+        encoding="utf-8-sig",
+        parse_dates=["day"],
+        dtype={
+            "pop": "int8",
+            "party": "category",
+            "screen_name": "category",
+            "new24": "bool",
+        },
+        true_values=["Yes"],
+        false_values=["No"],
+    )
+    df = df.sort_values("day", kind="mergesort", ignore_index=True)
+    df.to_parquet(
+        TARGET,
+        engine="pyarrow",
+        compression="zstd",
+        row_group_size=50_000,
+        index=False,
+    )
+    print(f"Wrote {len(df):,} rows to {TARGET}")
+
+
+if __name__ == "__main__":
+    main()